@@ -40,3 +40,44 @@ VENDOR_WEIGHTS = {
     "cost_efficiency":  0.35,
     "compliance":       0.25,
 }
+
+# Vendor KPI event aggregation: half-life (days) of the time-decayed KPI window,
+# JSON file holding the per-vendor sums and the last ingested event_id, and
+# events fetched per query when catching up with the delivery_events ledger
+KPI_HALF_LIFE_DAYS = 30
+KPI_STATE_PATH = os.getenv(
+    "KPI_STATE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "data", "output", "vendor_kpi_state.json"),
+)
+KPI_EVENT_BATCH = 50000
+
+# Carrier assignment: default max routes per carrier per run, and penalties
+# (fraction of route cost) for risk category and for each weighted-score point below 100
+CARRIER_MAX_ROUTES = 5
+CARRIER_RISK_PENALTY = {
+    "LOW":    0.00,
+    "MEDIUM": 0.05,
+    "HIGH":   0.15,
+}
+CARRIER_SCORE_PENALTY = 0.001
+
+# Zone result cache: JSON store of memoized zone results, capped at
+# ZONE_CACHE_MAX_ENTRIES (least recently used evicted first).
+# Bump DISTANCE_MATRIX_VERSION whenever the distance data is refreshed.
+ZONE_CACHE_PATH = os.getenv(
+    "ZONE_CACHE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "data", "output", "zone_result_cache.json"),
+)
+ZONE_CACHE_MAX_ENTRIES = 64
+DISTANCE_MATRIX_VERSION = os.getenv("DISTANCE_MATRIX_VERSION", "simulated")
+
+# Monte Carlo robustness simulation: default scenario count, per-stop
+# cancellation probability, lognormal spread of route load and of travel
+# time (shared per zone + per route), and overrun vs planned duration
+# beyond which a route's deliveries count as late
+SIM_SCENARIOS = 10000
+SIM_CANCEL_PROB = 0.05
+SIM_LOAD_SIGMA = 0.15
+SIM_ZONE_TRAVEL_SIGMA = 0.10
+SIM_ROUTE_TRAVEL_SIGMA = 0.15
+SIM_LATE_TOLERANCE = 0.20
@@ -8,6 +8,7 @@ Author: Mousumi Paul | Jan 2026
 
 import sys
 import os
+import numpy as np
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config.config import COST_PER_KM, MAX_LOAD_KG
@@ -17,6 +18,8 @@ from config.config import COST_PER_KM, MAX_LOAD_KG
 CONSOLIDATION_DISCOUNT = 0.12   # 12% savings from combining stops
 # Load-balance bonus: if load is between 60-90% of max, apply efficiency bonus
 LOAD_EFFICIENCY_BONUS  = 0.06   # 6% savings for optimal load usage
+LOAD_BONUS_MIN_PCT     = 0.60
+LOAD_BONUS_MAX_PCT     = 0.90
 
 
 def calculate_base_cost(distance_km: float) -> float:
@@ -65,7 +68,7 @@ def apply_load_balance_bonus(cost: float, total_load_kg: float) -> float:
         Adjusted cost after load-balance bonus
     """
     load_pct = total_load_kg / MAX_LOAD_KG
-    if 0.60 <= load_pct <= 0.90:
+    if LOAD_BONUS_MIN_PCT <= load_pct <= LOAD_BONUS_MAX_PCT:
         return round(cost * (1 - LOAD_EFFICIENCY_BONUS), 2)
     return cost
 
@@ -108,6 +111,71 @@ def calculate_route_cost(
     }
 
 
+def _round_cents(values) -> np.ndarray:
+    """
+    Round to 2 decimals exactly like Python's round(value, 2).
+
+    np.round rounds the float product value × 100, whose own rounding can
+    land a value just off half a cent exactly on it. Those cases are settled
+    from the exact error of the product (Dekker's split), as round() does.
+    """
+    values = np.asarray(values, dtype=float)
+    cents = np.asarray(values * 100)
+    rounded = np.array(np.rint(cents))
+    half = np.abs(cents - rounded) == 0.5
+    if half.any():
+        # Exact error of the × 100 product: × 4 is exact, and the split
+        # makes both partial products of × 25 exact
+        scaled = values[half] * 4
+        split = scaled * 134217729.0         # 2**27 + 1
+        high = split - (split - scaled)
+        error = (high * 25 - cents[half]) + (scaled - high) * 25
+        step = np.sign(cents[half] - rounded[half])
+        rounded[half] += step * (np.sign(error) == step)
+    return rounded / 100
+
+
+def calculate_route_cost_batch(
+    distance_km,
+    num_stops,
+    total_load_kg,
+    is_consolidated=False
+) -> dict:
+    """
+    Vectorized calculate_route_cost for NumPy arrays.
+
+    Inputs broadcast against each other, so per-route (routes,) distances
+    can be combined with (scenarios, routes) simulated loads and stops.
+    Costs round exactly as in calculate_route_cost.
+
+    Args:
+        distance_km     : Route distances
+        num_stops       : Delivery stops per route
+        total_load_kg   : Cargo weight per route
+        is_consolidated : Whether each route uses stop consolidation
+
+    Returns:
+        dict of arrays: base_cost_usd, after_consolidation_usd, final_cost_usd
+    """
+    distance_km   = np.asarray(distance_km, dtype=float)
+    num_stops     = np.asarray(num_stops)
+    total_load_kg = np.asarray(total_load_kg, dtype=float)
+
+    base_cost = _round_cents(distance_km * COST_PER_KM)
+    discounted = np.asarray(is_consolidated, dtype=bool) & (num_stops >= 2)
+    after_consolidation = np.where(discounted, _round_cents(base_cost * (1 - CONSOLIDATION_DISCOUNT)), base_cost)
+
+    load_pct = total_load_kg / MAX_LOAD_KG
+    bonus = (load_pct >= LOAD_BONUS_MIN_PCT) & (load_pct <= LOAD_BONUS_MAX_PCT)
+    final_cost = np.where(bonus, _round_cents(after_consolidation * (1 - LOAD_EFFICIENCY_BONUS)), after_consolidation)
+
+    return {
+        "base_cost_usd":           base_cost,
+        "after_consolidation_usd": after_consolidation,
+        "final_cost_usd":          final_cost,
+    }
+
+
 def summarize_zone_savings(routes: list) -> dict:
     """
     Summarize total cost and savings across all routes in a zone.
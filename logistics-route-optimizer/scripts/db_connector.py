@@ -63,6 +63,38 @@ def execute_query(query: str, params: tuple = None, fetch: bool = True):
             conn.close()
 
 
+def execute_transaction(statements: list) -> bool:
+    """
+    Execute several write statements as one transaction.
+
+    Args:
+        statements : List of (query, params) tuples, run in order
+
+    Returns:
+        True if every statement ran and was committed, False if rolled back
+    """
+    conn = get_connection()
+    if not conn:
+        return False
+
+    try:
+        cursor = conn.cursor()
+        for query, params in statements:
+            cursor.execute(query, params or ())
+        conn.commit()
+        return True
+
+    except Error as e:
+        conn.rollback()
+        print(f"[QUERY ERROR] {e}")
+        return False
+
+    finally:
+        if conn.is_connected():
+            cursor.close()
+            conn.close()
+
+
 def execute_script(filepath: str):
     """Execute a .sql file against the database."""
     with open(filepath, "r") as f:
@@ -0,0 +1,187 @@
+"""
+result_cache.py
+---------------
+Memoizes whole-zone optimization results between runs.
+
+Each zone result is keyed by a SHA-256 of the zone's order set, the
+distance-matrix version and the cost constants, so a zone whose inputs
+have not changed is served from the store instead of being re-solved.
+Changing any input yields a new key; the old entry is never matched again
+and ages out through LRU eviction (or can be dropped with invalidate()).
+
+Author: Mousumi Paul | Jan 2026
+
+Usage:
+    cache = ZoneResultCache()
+    key = zone_result_key("ZONE_A", orders)
+    hit = cache.get(key)                     # (routes, summary) or None
+    cache.put(key, "ZONE_A", routes, summary)
+    cache.save()                             # persist LRU order after lookups
+    cache.invalidate("ZONE_A")               # or invalidate() to clear all
+"""
+
+import os
+import sys
+import copy
+import json
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from config.config import (
+    COST_PER_KM, MAX_LOAD_KG, DISTANCE_MATRIX_VERSION,
+    ZONE_CACHE_PATH, ZONE_CACHE_MAX_ENTRIES,
+)
+from scripts.cost_calculator import (
+    CONSOLIDATION_DISCOUNT, LOAD_EFFICIENCY_BONUS, LOAD_BONUS_MIN_PCT, LOAD_BONUS_MAX_PCT,
+)
+
+
+# Bump when the stored route/summary layout changes so old entries never match
+CACHE_FORMAT = 1
+
+
+def cost_constants() -> dict:
+    """Cost parameters that feed calculate_route_cost."""
+    return {
+        "COST_PER_KM":            COST_PER_KM,
+        "MAX_LOAD_KG":            MAX_LOAD_KG,
+        "CONSOLIDATION_DISCOUNT": CONSOLIDATION_DISCOUNT,
+        "LOAD_EFFICIENCY_BONUS":  LOAD_EFFICIENCY_BONUS,
+        "LOAD_BONUS_MIN_PCT":     LOAD_BONUS_MIN_PCT,
+        "LOAD_BONUS_MAX_PCT":     LOAD_BONUS_MAX_PCT,
+    }
+
+
+def zone_result_key(zone_id: str, orders: list, distance_version: str = None) -> str:
+    """
+    Stable content hash of everything a zone's result depends on.
+
+    Args:
+        zone_id          : Zone identifier (e.g. 'ZONE_A')
+        orders           : The zone's order (or simulated route) records;
+                           record order does not affect the key
+        distance_version : Distance-matrix version (defaults to
+                           DISTANCE_MATRIX_VERSION in config.py)
+
+    Returns:
+        Hex digest identifying this zone's inputs
+    """
+    payload = {
+        "format":           CACHE_FORMAT,
+        "zone_id":          zone_id,
+        "orders":           sorted(json.dumps(o, sort_keys=True, default=str) for o in orders),
+        "distance_version": distance_version or DISTANCE_MATRIX_VERSION,
+        "costs":            cost_constants(),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _valid_entry(entry) -> bool:
+    """True if a loaded store entry has the layout put() writes."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("zone_id"), str)
+        and isinstance(entry.get("routes"), list)
+        and all(isinstance(r, dict) for r in entry["routes"])
+        and isinstance(entry.get("summary"), dict)
+    )
+
+
+class ZoneResultCache:
+    """
+    Size-bounded LRU store of zone results, persisted as JSON.
+
+    put() and invalidate() write the file; lookups only reorder entries in
+    memory, so call save() once a run is done to keep the LRU order.
+
+    Args:
+        path        : JSON file backing the store (None keeps it in memory)
+        max_entries : Entries kept before the least recently used is evicted
+    """
+
+    def __init__(self, path: str = ZONE_CACHE_PATH, max_entries: int = ZONE_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self._load()
+
+    def get(self, key: str):
+        """Return a copy of (routes, summary) stored under `key`, or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return copy.deepcopy(entry["routes"]), copy.deepcopy(entry["summary"])
+
+    def put(self, key: str, zone_id: str, routes: list, summary: dict):
+        """Store a zone result, evicting the least recently used beyond max_entries."""
+        self.entries[key] = json.loads(json.dumps({
+            "zone_id":   zone_id,
+            "stored_at": datetime.now().isoformat(timespec="seconds"),
+            "routes":    routes,
+            "summary":   summary,
+        }, default=str))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._save()
+
+    def invalidate(self, zone_id: str = None) -> int:
+        """
+        Drop stored results for one zone, or for every zone.
+
+        Args:
+            zone_id : Zone to invalidate; None clears the whole store
+
+        Returns:
+            Number of entries removed
+        """
+        stale = [k for k, e in self.entries.items() if zone_id is None or e["zone_id"] == zone_id]
+        for k in stale:
+            del self.entries[k]
+        if stale:
+            self._save()
+        return len(stale)
+
+    def save(self):
+        """Write the store, including the current LRU order, to `path`."""
+        self._save()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+            if not isinstance(stored, dict):
+                raise ValueError(f"expected an object of entries, got {type(stored).__name__}")
+        except (OSError, ValueError) as e:
+            print(f"[CACHE ERROR] Ignoring unreadable result store {self.path}: {e}")
+            return
+
+        self.entries = OrderedDict((k, e) for k, e in stored.items() if _valid_entry(e))
+        dropped = len(stored) - len(self.entries)
+        if dropped:
+            print(f"[CACHE ERROR] Ignoring {dropped} malformed entr{'y' if dropped == 1 else 'ies'} in {self.path}")
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+
+
+if __name__ == "__main__":
+    cache = ZoneResultCache()
+    print(f"[CACHE] {len(cache.entries)} stored zone result(s) in {cache.path}")
+    for key, entry in cache.entries.items():
+        print(f"  {entry['zone_id']}  {entry['stored_at']}  {key[:12]}  "
+              f"{entry['summary']['num_routes']} routes")
@@ -0,0 +1,176 @@
+"""
+rollups.py
+----------
+Incremental refresh of the zone rollup tables (zone_cost_rollup,
+zone_load_rollup, zone_demand_rollup) that back the SQL reports.
+
+Cost and load rollups hold one slice per (zone, optimization run); demand
+rollups hold one slice per (zone, delivery date), with undated orders in
+a NULL bucket. A refresh deletes and re-inserts only the affected slices
+in one transaction, so its cost depends on the size of one run or zone,
+not on the amount of route history stored.
+
+Author: Mousumi Paul | Jan 2026
+
+Usage:
+    python scripts/rollups.py          # full backfill of all rollups
+"""
+
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from config.config import ZONES
+from scripts.db_connector import execute_transaction
+
+
+# ──────────────────────────────────────────────
+# Slice refresh statements. The {where} fragment
+# restricts the recompute to one slice (or is a
+# catch-all for a full backfill); the same
+# fragment first clears that slice.
+# ──────────────────────────────────────────────
+COST_ROLLUP_SQL = """
+    INSERT INTO zone_cost_rollup
+        (zone_id, run_id, run_date, is_consolidated, route_count, total_cost, total_distance_km)
+    SELECT zone_id, run_id, DATE(MIN(created_at)), is_consolidated,
+           COUNT(*), ROUND(SUM(estimated_cost), 2), ROUND(SUM(total_distance_km), 2)
+    FROM routes
+    {where}
+    GROUP BY zone_id, run_id, is_consolidated
+"""
+
+LOAD_ROLLUP_SQL = """
+    INSERT INTO zone_load_rollup
+        (zone_id, run_id, run_date, route_count, total_load_kg, max_load_kg, min_load_kg,
+         overloaded_count, high_count, balanced_count, underutilized_count)
+    SELECT zone_id, run_id, DATE(MIN(created_at)),
+           COUNT(*), ROUND(SUM(total_load_kg), 2), MAX(total_load_kg), MIN(total_load_kg),
+           SUM(CASE WHEN total_load_kg > 900 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN total_load_kg > 700 AND total_load_kg <= 900 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN total_load_kg > 400 AND total_load_kg <= 700 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN total_load_kg <= 400 THEN 1 ELSE 0 END)
+    FROM routes
+    {where}
+    GROUP BY zone_id, run_id
+"""
+
+DEMAND_ROLLUP_SQL = """
+    INSERT INTO zone_demand_rollup
+        (zone_id, delivery_date, total_orders, total_load_kg,
+         high_priority, medium_priority, low_priority)
+    SELECT zone_id, delivery_date,
+           COUNT(*), ROUND(SUM(load_kg), 2),
+           SUM(CASE WHEN priority = 'HIGH'   THEN 1 ELSE 0 END),
+           SUM(CASE WHEN priority = 'MEDIUM' THEN 1 ELSE 0 END),
+           SUM(CASE WHEN priority = 'LOW'    THEN 1 ELSE 0 END)
+    FROM delivery_orders
+    {where}
+    GROUP BY zone_id, delivery_date
+"""
+
+# Served by idx_routes_zone_run / idx_orders_zone_date
+RUN_SLICE_WHERE  = "WHERE zone_id = %s AND run_id = %s"
+ZONE_SLICE_WHERE = "WHERE zone_id = %s"
+
+
+def _demand_slice(zone_id: str, delivery_dates=None):
+    """Build the WHERE fragment and params for a zone's demand slice."""
+    if delivery_dates is None:
+        return ZONE_SLICE_WHERE, (zone_id,)
+
+    dates = sorted({d for d in delivery_dates if d is not None})
+    conditions = []
+    if dates:
+        conditions.append(f"delivery_date IN ({', '.join(['%s'] * len(dates))})")
+    if any(d is None for d in delivery_dates):
+        conditions.append("delivery_date IS NULL")
+    if not conditions:
+        return None, None
+    return f"WHERE zone_id = %s AND ({' OR '.join(conditions)})", (zone_id, *dates)
+
+
+def zone_rollup_statements(zone_id: str, run_id: int = None, delivery_dates=None) -> list:
+    """
+    Build the statements that rebuild a zone's rollup slices.
+
+    Callers that write routes or orders can run these in the same
+    transaction as their own writes (see save_zone_routes).
+
+    Args:
+        zone_id        : Zone identifier (e.g. 'ZONE_A')
+        run_id         : Optimization run whose routes were just stored; its
+                         cost/load slice is rebuilt (skipped when None)
+        delivery_dates : Delivery dates whose orders changed (None entries
+                         mean undated orders); None rebuilds every date of
+                         the zone, an empty list skips the demand rollup
+
+    Returns:
+        List of (query, params) tuples for execute_transaction
+    """
+    statements = []
+    if run_id is not None:
+        params = (zone_id, run_id)
+        statements += [
+            (f"DELETE FROM zone_cost_rollup {RUN_SLICE_WHERE}", params),
+            (COST_ROLLUP_SQL.format(where=RUN_SLICE_WHERE), params),
+            (f"DELETE FROM zone_load_rollup {RUN_SLICE_WHERE}", params),
+            (LOAD_ROLLUP_SQL.format(where=RUN_SLICE_WHERE), params),
+        ]
+
+    where, params = _demand_slice(zone_id, delivery_dates)
+    if where:
+        statements += [
+            (f"DELETE FROM zone_demand_rollup {where}", params),
+            (DEMAND_ROLLUP_SQL.format(where=where), params),
+        ]
+    return statements
+
+
+def refresh_zone_rollups(zone_id: str, run_id: int = None, delivery_dates=None) -> bool:
+    """
+    Recompute a zone's rollups after a run is persisted or its orders change.
+
+    Args:
+        zone_id        : Zone identifier (e.g. 'ZONE_A')
+        run_id         : See zone_rollup_statements
+        delivery_dates : See zone_rollup_statements
+
+    Returns:
+        True if the refresh transaction committed, else False
+    """
+    statements = zone_rollup_statements(zone_id, run_id, delivery_dates)
+    if not statements:
+        return True
+    ok = execute_transaction(statements)
+    if ok:
+        print(f"[ROLLUP] Refreshed {zone_id} rollups" + (f" for run {run_id}" if run_id is not None else ""))
+    return ok
+
+
+def backfill_rollups() -> bool:
+    """
+    Rebuild every rollup table from the full route and order history.
+
+    Intended for first-time setup or after bulk loads that bypass the
+    pipeline (seed data, order imports); routine runs should use
+    refresh_zone_rollups(). Routes stored without a run_id are not
+    attributable to a run and are skipped; on a database created before
+    run ids existed, run sql/migrate_rollups.sql first, which assigns
+    legacy routes to runs.
+    """
+    ok = execute_transaction([
+        ("DELETE FROM zone_cost_rollup", None),
+        (COST_ROLLUP_SQL.format(where="WHERE run_id IS NOT NULL"), None),
+        ("DELETE FROM zone_load_rollup", None),
+        (LOAD_ROLLUP_SQL.format(where="WHERE run_id IS NOT NULL"), None),
+        ("DELETE FROM zone_demand_rollup", None),
+        (DEMAND_ROLLUP_SQL.format(where=""), None),
+    ])
+    if ok:
+        print(f"[ROLLUP] Backfilled rollups for {len(ZONES)} zones")
+    return ok
+
+
+if __name__ == "__main__":
+    backfill_rollups()
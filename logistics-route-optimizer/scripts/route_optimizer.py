@@ -14,12 +14,15 @@ Usage:
 import sys
 import os
 import json
+import time
 from tabulate import tabulate
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config.config import ZONES, MAX_LOAD_KG
-from scripts.db_connector import execute_query
+from scripts.db_connector import execute_query, execute_transaction
 from scripts.cost_calculator import calculate_route_cost, summarize_zone_savings
+from scripts.rollups import zone_rollup_statements
+from scripts.result_cache import ZoneResultCache, zone_result_key
 
 # NOTE: Uncomment maps_api import when a real API key is configured
 # from scripts.maps_api import get_distance_matrix, get_route_details
@@ -89,13 +92,15 @@ def group_orders_into_routes(orders: list) -> list:
     return routes
 
 
-def optimize_zone(zone_id: str, use_simulation: bool = True) -> list:
+def optimize_zone(zone_id: str, use_simulation: bool = True, orders: list = None) -> list:
     """
     Run full optimization for a single distribution zone.
 
     Args:
         zone_id        : Zone identifier (e.g. 'ZONE_A')
         use_simulation : If True, use simulated distances; else call Maps API
+        orders         : Live mode only: the zone's delivery orders, if
+                         already fetched (fetched from MySQL when None)
 
     Returns:
         List of route cost dicts
@@ -108,7 +113,8 @@ def optimize_zone(zone_id: str, use_simulation: bool = True) -> list:
         route_data = SIMULATED_DISTANCES.get(zone_id, [])
     else:
         # Live mode: fetch orders from DB, call Maps API
-        orders = fetch_delivery_orders(zone_id)
+        if orders is None:
+            orders = fetch_delivery_orders(zone_id)
         route_groups = group_orders_into_routes(orders)
         route_data = []
         for i, group in enumerate(route_groups):
@@ -133,6 +139,7 @@ def optimize_zone(zone_id: str, use_simulation: bool = True) -> list:
         cost_info["route_name"] = rd["route_name"]
         cost_info["zone_id"]    = zone_id
         cost_info["duration_min"] = rd.get("duration_min", 0)
+        cost_info["is_consolidated"] = rd.get("consolidated", False)
         results.append(cost_info)
 
     # Sort by final cost ascending (rank 1 = cheapest)
@@ -143,6 +150,58 @@ def optimize_zone(zone_id: str, use_simulation: bool = True) -> list:
     return results
 
 
+def new_run_id() -> int:
+    """Identifier for one optimization run (epoch milliseconds)."""
+    return int(time.time() * 1000)
+
+
+def save_zone_routes(zone_id: str, routes: list, run_id: int = None) -> int:
+    """
+    Persist ranked routes for a zone to the MySQL routes table and
+    incrementally refresh that zone's rollups for this run.
+
+    The inserts and the rollup refresh run in one transaction, so the
+    reports never show a run whose rollup is missing or stale.
+
+    Args:
+        zone_id : Zone identifier (e.g. 'ZONE_A')
+        routes  : List of route cost dicts (output of optimize_zone)
+        run_id  : Optimization run the routes belong to (new run if None)
+
+    Returns:
+        Number of routes stored (0 if the transaction was rolled back)
+    """
+    if not routes:
+        return 0
+    run_id = run_id or new_run_id()
+    query = """
+        INSERT INTO routes (run_id, zone_id, route_name, total_distance_km, total_duration_min,
+                            total_load_kg, estimated_cost, is_consolidated)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    """
+    statements = [
+        (query, (
+            run_id,
+            zone_id,
+            r["route_name"],
+            r["distance_km"],
+            r.get("duration_min", 0),
+            r["total_load_kg"],
+            r["final_cost_usd"],
+            r.get("is_consolidated", False),
+        ))
+        for r in routes
+    ]
+    # Storing routes does not change orders, so the demand rollup is left alone
+    statements += zone_rollup_statements(zone_id, run_id, delivery_dates=[])
+
+    if not execute_transaction(statements):
+        print(f"[DB ERROR] {zone_id} routes for run {run_id} were not stored; rollups unchanged")
+        return 0
+    print(f"[DB] Stored {len(routes)} {zone_id} routes and refreshed rollups for run {run_id}")
+    return len(routes)
+
+
 def print_zone_results(zone_id: str, routes: list):
     """Pretty-print route ranking table for a zone."""
     table_data = [
@@ -162,22 +221,53 @@ def print_zone_results(zone_id: str, routes: list):
     print(tabulate(table_data, headers=headers, tablefmt="rounded_outline"))
 
 
-def run_full_optimization():
-    """Run optimization across all 3 distribution zones and print summary."""
+def run_full_optimization(persist: bool = False, use_cache: bool = True, use_simulation: bool = True):
+    """
+    Run optimization across all 3 distribution zones and print summary.
+
+    Args:
+        persist        : If True, store routes in MySQL and refresh the zone rollups
+        use_cache      : If True, reuse stored results for zones whose orders,
+                         distance-matrix version and cost constants are unchanged
+        use_simulation : If True, use simulated distances; else optimize the
+                         delivery orders stored in MySQL
+    """
     print("\n🚚 Logistics Route Optimization Planner")
     print("   Author: Mousumi Paul | Jan 2026\n")
 
     all_zone_summaries = []
+    cache = ZoneResultCache() if use_cache else None
+    run_id = new_run_id() if persist else None
 
     for zone_id in ZONES:
-        routes = optimize_zone(zone_id)
+        # Key on exactly what optimize_zone reads: the simulated routes, or
+        # the zone's orders as fetched (passed through so they are read once)
+        if use_simulation:
+            inputs, orders = SIMULATED_DISTANCES.get(zone_id, []), None
+        else:
+            inputs = orders = fetch_delivery_orders(zone_id)
+        key = zone_result_key(zone_id, inputs)
+        cached = cache.get(key) if cache else None
+        if cached:
+            routes, summary = cached
+            print(f"\n[CACHE] {zone_id} unchanged — reusing stored result")
+        else:
+            routes = optimize_zone(zone_id, use_simulation, orders)
+            summary = summarize_zone_savings(routes)
+            if cache:
+                cache.put(key, zone_id, routes, summary)
+
         print_zone_results(zone_id, routes)
+        if persist:
+            save_zone_routes(zone_id, routes, run_id)
 
-        summary = summarize_zone_savings(routes)
         summary["zone_id"]   = zone_id
         summary["zone_name"] = ZONES[zone_id]
         all_zone_summaries.append(summary)
 
+    if cache:
+        cache.save()
+
     # Overall summary
     print(f"\n{'='*55}")
     print("  OVERALL SUMMARY — All Zones")
@@ -0,0 +1,199 @@
+"""
+route_simulation.py
+-------------------
+Monte Carlo robustness check for a route plan.
+
+Samples demand and travel-time scenarios for every route at once as NumPy
+arrays and prices them with the batch cost model from cost_calculator:
+  - stops cancel independently (SIM_CANCEL_PROB); the route's load scales
+    with the stops kept, times a lognormal demand factor (SIM_LOAD_SIGMA)
+  - travel time is the planned duration times a lognormal delay shared by
+    the zone (congestion) and one per route
+  - distance stays as planned (cancellations do not re-sequence the route)
+
+Scenarios are processed in chunks on a thread pool (NumPy releases the GIL
+for the heavy array work), and results are aggregated per zone.
+
+Author: Mousumi Paul | Jan 2026
+
+Usage:
+    python scripts/route_simulation.py
+"""
+
+import sys
+import os
+from math import comb
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from tabulate import tabulate
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from config.config import (
+    ZONES, MAX_LOAD_KG, SIM_SCENARIOS, SIM_CANCEL_PROB, SIM_LOAD_SIGMA,
+    SIM_ZONE_TRAVEL_SIGMA, SIM_ROUTE_TRAVEL_SIGMA, SIM_LATE_TOLERANCE,
+)
+from scripts.cost_calculator import calculate_route_cost_batch
+
+
+# Upper bound on (scenarios × routes) cells per chunk, to cap memory use
+CHUNK_CELLS = 2_000_000
+
+
+def _lognormal(rng, sigma: float, size) -> np.ndarray:
+    """Mean-1 lognormal factors."""
+    return np.exp(sigma * rng.standard_normal(size) - sigma ** 2 / 2)
+
+
+def _cancel_cdf(num_stops: np.ndarray, p: float) -> np.ndarray:
+    """
+    Per-route CDF of the number of cancelled stops, Binomial(num_stops, p).
+
+    Columns past the point where every route's CDF reaches 1 are dropped,
+    so sampling is a few comparisons against one uniform draw per cell,
+    which is much cheaper than rng.binomial with per-route n.
+    """
+    n_max = int(num_stops.max()) if num_stops.size else 0
+    k = np.arange(n_max + 1)
+    table = np.array([
+        [comb(n, j) * p ** j * (1 - p) ** (n - j) if j <= n else 0.0 for j in k]
+        for n in k
+    ]).cumsum(axis=1)
+    table[k[None, :] >= k[:, None]] = 1.0
+    table[table > 1 - 1e-12] = 1.0
+    needed = int((table < 1.0).any(axis=0).sum())
+    return table[num_stops, :needed]
+
+
+def _simulate_chunk(plan: dict, num_scenarios: int, seed) -> dict:
+    """Simulate one chunk of scenarios; returns per-zone (scenarios, zones) totals."""
+    rng = np.random.default_rng(seed)
+    shape = (num_scenarios, plan["num_routes"])
+
+    u = rng.random(shape)
+    cancelled = np.zeros(shape, dtype=int)
+    for threshold in plan["cancel_cdf"].T:
+        cancelled += u > threshold
+    stops = plan["num_stops"] - cancelled
+    kept = stops / np.maximum(plan["num_stops"], 1)
+    load = plan["load_kg"] * kept * _lognormal(rng, SIM_LOAD_SIGMA, shape)
+
+    zone_delay = _lognormal(rng, SIM_ZONE_TRAVEL_SIGMA, (num_scenarios, plan["num_zones"]))
+    delay = zone_delay[:, plan["zone_idx"]] * _lognormal(rng, SIM_ROUTE_TRAVEL_SIGMA, shape)
+
+    runs = stops > 0
+    cost = calculate_route_cost_batch(plan["distance_km"], stops, load, plan["is_consolidated"])["final_cost_usd"]
+    cost = np.where(runs, cost, 0.0)
+    overloaded = runs & (load > MAX_LOAD_KG)
+    late = runs & (delay > 1 + SIM_LATE_TOLERANCE)
+
+    # (scenarios, routes) @ (routes, zones) one-hot → per-zone totals
+    onehot = plan["onehot"]
+    return {
+        "cost_usd":         cost @ onehot,
+        "overloaded":       overloaded.astype(float) @ onehot,
+        "late_deliveries":  np.where(late, stops, 0).astype(float) @ onehot,
+        "deliveries":       stops.astype(float) @ onehot,
+    }
+
+
+def simulate_plan(routes: list, num_scenarios: int = SIM_SCENARIOS, seed: int = None,
+                  workers: int = None) -> dict:
+    """
+    Run Monte Carlo scenarios over a route plan.
+
+    Args:
+        routes        : List of route cost dicts (output of optimize_zone, any
+                        number of zones)
+        num_scenarios : Number of scenarios to sample (at least 1)
+        seed          : Random seed; the same seed gives the same result
+                        regardless of `workers`
+        workers       : Threads to use (defaults to the CPU count)
+
+    Returns:
+        dict with `zones` (zone ids), `planned_cost_usd` (per zone) and
+        (num_scenarios, zones) arrays: cost_usd, overloaded, late_deliveries,
+        deliveries
+    """
+    if num_scenarios < 1:
+        raise ValueError(f"[SIM] num_scenarios must be at least 1, got {num_scenarios}")
+
+    zones = list(dict.fromkeys(r["zone_id"] for r in routes))
+    zone_idx = np.array([zones.index(r["zone_id"]) for r in routes], dtype=int)
+    plan = {
+        "num_routes":      len(routes),
+        "num_zones":       len(zones),
+        "zone_idx":        zone_idx,
+        "onehot":          np.eye(len(zones))[zone_idx],
+        "distance_km":     np.array([r["distance_km"] for r in routes], dtype=float),
+        "num_stops":       np.array([r.get("num_stops", 1) for r in routes], dtype=int),
+        "load_kg":         np.array([r.get("total_load_kg", 0) for r in routes], dtype=float),
+        "is_consolidated": np.array([r.get("is_consolidated", False) for r in routes], dtype=bool),
+    }
+    plan["cancel_cdf"] = _cancel_cdf(plan["num_stops"], SIM_CANCEL_PROB)
+
+    chunk = max(1, min(num_scenarios, CHUNK_CELLS // max(len(routes), 1)))
+    sizes = [min(chunk, num_scenarios - start) for start in range(0, num_scenarios, chunk)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        parts = list(pool.map(lambda args: _simulate_chunk(plan, *args), zip(sizes, seeds)))
+
+    result = {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+    result["zones"] = zones
+    result["planned_cost_usd"] = np.array([
+        sum(r["final_cost_usd"] for r in routes if r["zone_id"] == z) for z in zones
+    ])
+    return result
+
+
+def summarize_simulation(result: dict) -> list:
+    """
+    Summarize scenario distributions per zone.
+
+    Args:
+        result : Output of simulate_plan
+
+    Returns:
+        List of per-zone dicts with cost percentiles, overload probability
+        and late-delivery statistics
+    """
+    cost = result["cost_usd"]
+    p5, p50, p95 = np.percentile(cost, [5, 50, 95], axis=0)
+    late_p95 = np.percentile(result["late_deliveries"], 95, axis=0)
+    late_rate = result["late_deliveries"].sum(axis=0) / np.maximum(result["deliveries"].sum(axis=0), 1)
+
+    summaries = []
+    for i, zone_id in enumerate(result["zones"]):
+        summaries.append({
+            "zone_id":              zone_id,
+            "scenarios":            len(cost),
+            "planned_cost_usd":     round(float(result["planned_cost_usd"][i]), 2),
+            "mean_cost_usd":        round(float(cost[:, i].mean()), 2),
+            "p5_cost_usd":          round(float(p5[i]), 2),
+            "p50_cost_usd":         round(float(p50[i]), 2),
+            "p95_cost_usd":         round(float(p95[i]), 2),
+            "overload_prob_pct":    round(float((result["overloaded"][:, i] > 0).mean() * 100), 1),
+            "mean_overloaded":      round(float(result["overloaded"][:, i].mean()), 2),
+            "late_delivery_pct":    round(float(late_rate[i] * 100), 1),
+            "p95_late_deliveries":  round(float(late_p95[i]), 1),
+        })
+    return summaries
+
+
+if __name__ == "__main__":
+    import time
+    from scripts.route_optimizer import optimize_zone
+
+    plan = [r for zone_id in ZONES for r in optimize_zone(zone_id)]
+    start = time.perf_counter()
+    summaries = summarize_simulation(simulate_plan(plan, seed=42))
+    elapsed = time.perf_counter() - start
+
+    print(f"\n[SIM] {SIM_SCENARIOS} scenarios × {len(plan)} routes in {elapsed:.2f}s")
+    print(tabulate(
+        [[s["zone_id"], f'${s["planned_cost_usd"]}', f'${s["mean_cost_usd"]}',
+          f'${s["p5_cost_usd"]} – ${s["p95_cost_usd"]}', f'{s["overload_prob_pct"]}%',
+          f'{s["late_delivery_pct"]}%', s["p95_late_deliveries"]] for s in summaries],
+        headers=["Zone", "Planned", "Mean Cost", "Cost p5–p95", "P(Overload)", "Late %", "Late p95"],
+        tablefmt="rounded_outline",
+    ))
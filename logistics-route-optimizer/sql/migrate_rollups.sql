@@ -0,0 +1,57 @@
+-- ============================================================
+-- migrate_rollups.sql
+-- One-time migration of a database created before the rollup tables
+-- Author: Mousumi Paul | Jan 2026
+--
+-- schema.sql only creates missing tables, so on an existing database
+-- run it first (it adds the rollup and delivery_events tables), then
+-- run this file once, then backfill the rollups:
+--
+--     mysql -u your_user -p < sql/schema.sql
+--     mysql -u your_user -p logistics_db < sql/migrate_rollups.sql
+--     python scripts/rollups.py
+-- ============================================================
+
+USE logistics_db;
+
+-- -----------------------------------------------
+-- Run identifier + indexes used by the reports
+-- and the slice refreshes in scripts/rollups.py
+-- -----------------------------------------------
+ALTER TABLE routes
+    ADD COLUMN run_id BIGINT AFTER route_id,
+    ADD INDEX idx_routes_zone_run (zone_id, run_id);
+
+ALTER TABLE delivery_orders
+    ADD INDEX idx_orders_zone_date (zone_id, delivery_date);
+
+ALTER TABLE route_orders
+    ADD INDEX idx_route_orders_route (route_id, stop_sequence),
+    ADD INDEX idx_route_orders_order (order_id);
+
+-- -----------------------------------------------
+-- Legacy routes: stored one row at a time with no run id.
+-- Rows of a zone written less than 60 s apart are treated
+-- as one run, whose id is the epoch ms of its first row
+-- (the same scale as new_run_id(), so they sort before any
+-- new run). backfill_rollups() then includes them.
+-- -----------------------------------------------
+UPDATE routes r
+JOIN (
+    SELECT route_id,
+           UNIX_TIMESTAMP(MIN(created_at) OVER (PARTITION BY zone_id, session)) * 1000 AS run_id
+    FROM (
+        SELECT route_id, zone_id, created_at,
+               SUM(starts_run) OVER (PARTITION BY zone_id ORDER BY created_at, route_id) AS session
+        FROM (
+            SELECT route_id, zone_id, created_at,
+                   CASE WHEN TIMESTAMPDIFF(SECOND,
+                                           LAG(created_at) OVER (PARTITION BY zone_id ORDER BY created_at, route_id),
+                                           created_at) < 60
+                        THEN 0 ELSE 1 END AS starts_run
+            FROM routes
+            WHERE run_id IS NULL
+        ) gaps
+    ) sessions
+) legacy ON legacy.route_id = r.route_id
+SET r.run_id = legacy.run_id;
@@ -2,11 +2,20 @@
 -- load_balancing.sql
 -- Identifies overloaded routes and suggests rebalancing
 -- Author: Mousumi Paul | Jan 2026
+--
+-- Per-route checks are limited to each zone's latest run (taken from
+-- zone_load_rollup); the zone summary reads the rollup directly.
+-- Rollups are refreshed by scripts/rollups.py.
 -- ============================================================
 
 USE logistics_db;
 
 -- Show routes exceeding 80% vehicle capacity (MAX_LOAD = 1000 kg)
+WITH latest_run AS (
+    SELECT zone_id, MAX(run_id) AS run_id
+    FROM zone_load_rollup
+    GROUP BY zone_id
+)
 SELECT
     r.route_id,
     r.zone_id,
@@ -19,24 +28,40 @@ SELECT
         WHEN r.total_load_kg > 400 THEN 'BALANCED'
         ELSE 'UNDERUTILIZED'
     END AS load_status
-FROM routes r
+FROM latest_run lr
+JOIN routes r
+  ON r.zone_id = lr.zone_id
+ AND r.run_id = lr.run_id
 ORDER BY r.total_load_kg DESC;
 
 
--- Load balance summary per zone: identify imbalance
+-- Load balance summary per zone: identify imbalance (latest run per zone)
 SELECT
-    r.zone_id,
-    COUNT(*) AS num_routes,
-    ROUND(AVG(r.total_load_kg), 2) AS avg_load_kg,
-    MAX(r.total_load_kg)           AS max_load_kg,
-    MIN(r.total_load_kg)           AS min_load_kg,
-    ROUND(MAX(r.total_load_kg) - MIN(r.total_load_kg), 2) AS load_variance
-FROM routes r
-GROUP BY r.zone_id
+    l.zone_id,
+    l.route_count                                 AS num_routes,
+    ROUND(l.total_load_kg / l.route_count, 2)     AS avg_load_kg,
+    l.max_load_kg,
+    l.min_load_kg,
+    ROUND(l.max_load_kg - l.min_load_kg, 2)       AS load_variance,
+    l.overloaded_count,
+    l.high_count,
+    l.balanced_count,
+    l.underutilized_count
+FROM zone_load_rollup l
+JOIN (
+    SELECT zone_id, MAX(run_id) AS run_id
+    FROM zone_load_rollup
+    GROUP BY zone_id
+) lr ON l.zone_id = lr.zone_id AND l.run_id = lr.run_id
 ORDER BY load_variance DESC;
 
 
 -- Orders that could be redistributed (HIGH priority, within load limit headroom)
+WITH latest_run AS (
+    SELECT zone_id, MAX(run_id) AS run_id
+    FROM zone_load_rollup
+    GROUP BY zone_id
+)
 SELECT
     do.order_id,
     do.zone_id,
@@ -45,9 +70,12 @@ SELECT
     do.priority,
     ro.route_id AS current_route,
     r.total_load_kg AS current_route_load
-FROM delivery_orders do
-JOIN route_orders ro ON do.order_id = ro.order_id
-JOIN routes r ON ro.route_id = r.route_id
+FROM latest_run lr
+JOIN routes r
+  ON r.zone_id = lr.zone_id
+ AND r.run_id = lr.run_id
+JOIN route_orders ro ON ro.route_id = r.route_id
+JOIN delivery_orders do ON do.order_id = ro.order_id
 WHERE r.total_load_kg > 700
   AND do.priority != 'HIGH'
 ORDER BY r.total_load_kg DESC;
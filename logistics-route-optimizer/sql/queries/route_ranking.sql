@@ -2,11 +2,20 @@
 -- route_ranking.sql
 -- Ranks all routes by estimated cost (ascending)
 -- Author: Mousumi Paul | Jan 2026
+--
+-- Reads the latest run from zone_cost_rollup and only ranks and
+-- summarizes that run's routes (idx_routes_zone_run), so cost does
+-- not grow with route history. Rollups are refreshed by scripts/rollups.py.
 -- ============================================================
 
 USE logistics_db;
 
--- Rank routes by total estimated cost within each zone
+-- Rank routes by total estimated cost within each zone (latest run per zone)
+WITH latest_run AS (
+    SELECT zone_id, MAX(run_id) AS run_id
+    FROM zone_cost_rollup
+    GROUP BY zone_id
+)
 SELECT
     r.route_id,
     r.zone_id,
@@ -19,21 +28,32 @@ SELECT
     r.is_consolidated,
     RANK() OVER (PARTITION BY r.zone_id ORDER BY r.estimated_cost ASC) AS cost_rank,
     RANK() OVER (PARTITION BY r.zone_id ORDER BY r.total_distance_km ASC) AS distance_rank
-FROM routes r
+FROM latest_run lr
+JOIN routes r
+  ON r.zone_id = lr.zone_id
+ AND r.run_id = lr.run_id
 JOIN distribution_zones dz ON r.zone_id = dz.zone_id
 ORDER BY r.zone_id, cost_rank;
 
 
--- Summary: average cost per zone, consolidated vs non-consolidated
+-- Summary: average cost per zone, consolidated vs non-consolidated (latest run per zone)
+WITH latest_run AS (
+    SELECT zone_id, MAX(run_id) AS run_id
+    FROM zone_cost_rollup
+    GROUP BY zone_id
+)
 SELECT
-    r.zone_id,
+    c.zone_id,
     dz.zone_name,
-    r.is_consolidated,
-    COUNT(*) AS route_count,
-    ROUND(AVG(r.estimated_cost), 2) AS avg_cost,
-    ROUND(AVG(r.total_distance_km), 2) AS avg_distance_km,
-    ROUND(SUM(r.estimated_cost), 2) AS total_cost
-FROM routes r
-JOIN distribution_zones dz ON r.zone_id = dz.zone_id
-GROUP BY r.zone_id, dz.zone_name, r.is_consolidated
-ORDER BY r.zone_id, r.is_consolidated;
+    c.is_consolidated,
+    SUM(c.route_count) AS route_count,
+    ROUND(SUM(c.total_cost) / SUM(c.route_count), 2)        AS avg_cost,
+    ROUND(SUM(c.total_distance_km) / SUM(c.route_count), 2) AS avg_distance_km,
+    ROUND(SUM(c.total_cost), 2) AS total_cost
+FROM latest_run lr
+JOIN zone_cost_rollup c
+  ON c.zone_id = lr.zone_id
+ AND c.run_id = lr.run_id
+JOIN distribution_zones dz ON c.zone_id = dz.zone_id
+GROUP BY c.zone_id, dz.zone_name, c.is_consolidated
+ORDER BY c.zone_id, c.is_consolidated;
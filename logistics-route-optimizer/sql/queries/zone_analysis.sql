@@ -2,6 +2,11 @@
 -- zone_analysis.sql
 -- Breakdown of delivery demand and cost per distribution zone
 -- Author: Mousumi Paul | Jan 2026
+--
+-- Reads zone_demand_rollup / zone_cost_rollup instead of scanning
+-- delivery_orders and routes. Cost figures cover each zone's latest
+-- run only, since every re-run persists a full set of routes again.
+-- Rollups are refreshed by scripts/rollups.py.
 -- ============================================================
 
 USE logistics_db;
@@ -10,27 +15,35 @@ USE logistics_db;
 SELECT
     dz.zone_id,
     dz.zone_name,
-    COUNT(do.order_id)              AS total_orders,
-    ROUND(SUM(do.load_kg), 2)       AS total_load_kg,
-    ROUND(AVG(do.load_kg), 2)       AS avg_load_kg,
-    SUM(CASE WHEN do.priority = 'HIGH'   THEN 1 ELSE 0 END) AS high_priority,
-    SUM(CASE WHEN do.priority = 'MEDIUM' THEN 1 ELSE 0 END) AS medium_priority,
-    SUM(CASE WHEN do.priority = 'LOW'    THEN 1 ELSE 0 END) AS low_priority
+    COALESCE(SUM(d.total_orders), 0)                         AS total_orders,
+    ROUND(COALESCE(SUM(d.total_load_kg), 0), 2)              AS total_load_kg,
+    ROUND(SUM(d.total_load_kg) / NULLIF(SUM(d.total_orders), 0), 2) AS avg_load_kg,
+    COALESCE(SUM(d.high_priority), 0)                        AS high_priority,
+    COALESCE(SUM(d.medium_priority), 0)                      AS medium_priority,
+    COALESCE(SUM(d.low_priority), 0)                         AS low_priority
 FROM distribution_zones dz
-LEFT JOIN delivery_orders do ON dz.zone_id = do.zone_id
+LEFT JOIN zone_demand_rollup d ON dz.zone_id = d.zone_id
 GROUP BY dz.zone_id, dz.zone_name
 ORDER BY total_orders DESC;
 
 
--- Cost concentration: which zone has the highest logistics cost?
+-- Cost concentration: which zone has the highest logistics cost? (latest run per zone)
+WITH latest_run AS (
+    SELECT zone_id, MAX(run_id) AS run_id
+    FROM zone_cost_rollup
+    GROUP BY zone_id
+)
 SELECT
     dz.zone_id,
     dz.zone_name,
-    ROUND(SUM(r.estimated_cost), 2)                            AS total_zone_cost,
-    ROUND(SUM(r.estimated_cost) / SUM(SUM(r.estimated_cost))
+    ROUND(SUM(c.total_cost), 2)                                AS total_zone_cost,
+    ROUND(SUM(c.total_cost) / SUM(SUM(c.total_cost))
           OVER () * 100, 1)                                    AS pct_of_total_cost,
-    ROUND(AVG(r.estimated_cost), 2)                            AS avg_route_cost
-FROM routes r
-JOIN distribution_zones dz ON r.zone_id = dz.zone_id
+    ROUND(SUM(c.total_cost) / SUM(c.route_count), 2)           AS avg_route_cost
+FROM latest_run lr
+JOIN zone_cost_rollup c
+  ON c.zone_id = lr.zone_id
+ AND c.run_id = lr.run_id
+JOIN distribution_zones dz ON c.zone_id = dz.zone_id
 GROUP BY dz.zone_id, dz.zone_name
 ORDER BY total_zone_cost DESC;
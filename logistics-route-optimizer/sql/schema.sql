@@ -34,6 +34,7 @@ CREATE TABLE IF NOT EXISTS delivery_orders (
     priority        ENUM('LOW','MEDIUM','HIGH') DEFAULT 'MEDIUM',
     delivery_date   DATE,
     created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_orders_zone_date (zone_id, delivery_date),
     FOREIGN KEY (zone_id) REFERENCES distribution_zones(zone_id)
 );
 
@@ -42,6 +43,7 @@ CREATE TABLE IF NOT EXISTS delivery_orders (
 -- -----------------------------------------------
 CREATE TABLE IF NOT EXISTS routes (
     route_id        INT AUTO_INCREMENT PRIMARY KEY,
+    run_id          BIGINT,         -- optimization run (epoch ms), shared by all zones of a run
     zone_id         VARCHAR(10),
     route_name      VARCHAR(100),
     total_distance_km DECIMAL(8,2),
@@ -50,6 +52,7 @@ CREATE TABLE IF NOT EXISTS routes (
     estimated_cost  DECIMAL(10,2),
     is_consolidated BOOLEAN DEFAULT FALSE,
     created_at      TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_routes_zone_run (zone_id, run_id),
     FOREIGN KEY (zone_id) REFERENCES distribution_zones(zone_id)
 );
 
@@ -61,6 +64,8 @@ CREATE TABLE IF NOT EXISTS route_orders (
     route_id    INT,
     order_id    INT,
     stop_sequence INT,
+    INDEX idx_route_orders_route (route_id, stop_sequence),
+    INDEX idx_route_orders_order (order_id),
     FOREIGN KEY (route_id) REFERENCES routes(route_id),
     FOREIGN KEY (order_id) REFERENCES delivery_orders(order_id)
 );
@@ -92,3 +97,79 @@ CREATE TABLE IF NOT EXISTS vendor_scorecard (
     rank            INT,
     FOREIGN KEY (vendor_id) REFERENCES vendors(vendor_id)
 );
+
+-- -----------------------------------------------
+-- Rollup: Zone Cost per Optimization Run
+-- (consolidated vs non-consolidated split)
+-- -----------------------------------------------
+CREATE TABLE IF NOT EXISTS zone_cost_rollup (
+    zone_id             VARCHAR(10),
+    run_id              BIGINT,
+    run_date            DATE,
+    is_consolidated     BOOLEAN,
+    route_count         INT           NOT NULL DEFAULT 0,
+    total_cost          DECIMAL(14,2) NOT NULL DEFAULT 0,
+    total_distance_km   DECIMAL(12,2) NOT NULL DEFAULT 0,
+    refreshed_at        TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (zone_id, run_id, is_consolidated),
+    INDEX idx_cost_rollup_date (run_date),
+    FOREIGN KEY (zone_id) REFERENCES distribution_zones(zone_id)
+);
+
+-- -----------------------------------------------
+-- Rollup: Zone Load Status per Optimization Run
+-- (buckets match load_balancing.sql thresholds)
+-- -----------------------------------------------
+CREATE TABLE IF NOT EXISTS zone_load_rollup (
+    zone_id             VARCHAR(10),
+    run_id              BIGINT,
+    run_date            DATE,
+    route_count         INT           NOT NULL DEFAULT 0,
+    total_load_kg       DECIMAL(12,2) NOT NULL DEFAULT 0,
+    max_load_kg         DECIMAL(8,2),
+    min_load_kg         DECIMAL(8,2),
+    overloaded_count    INT           NOT NULL DEFAULT 0,   -- > 900 kg
+    high_count          INT           NOT NULL DEFAULT 0,   -- 700–900 kg
+    balanced_count      INT           NOT NULL DEFAULT 0,   -- 400–700 kg
+    underutilized_count INT           NOT NULL DEFAULT 0,   -- <= 400 kg
+    refreshed_at        TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (zone_id, run_id),
+    INDEX idx_load_rollup_date (run_date),
+    FOREIGN KEY (zone_id) REFERENCES distribution_zones(zone_id)
+);
+
+-- -----------------------------------------------
+-- Rollup: Zone Order Demand per Delivery Date
+-- (orders without a delivery date share the NULL bucket)
+-- -----------------------------------------------
+CREATE TABLE IF NOT EXISTS zone_demand_rollup (
+    id                  INT AUTO_INCREMENT PRIMARY KEY,
+    zone_id             VARCHAR(10),
+    delivery_date       DATE,
+    total_orders        INT           NOT NULL DEFAULT 0,
+    total_load_kg       DECIMAL(12,2) NOT NULL DEFAULT 0,
+    high_priority       INT           NOT NULL DEFAULT 0,
+    medium_priority     INT           NOT NULL DEFAULT 0,
+    low_priority        INT           NOT NULL DEFAULT 0,
+    refreshed_at        TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_demand_zone_date (zone_id, delivery_date),
+    FOREIGN KEY (zone_id) REFERENCES distribution_zones(zone_id)
+);
+
+-- -----------------------------------------------
+-- Delivery Events (append-only ledger feeding vendor KPIs)
+-- -----------------------------------------------
+CREATE TABLE IF NOT EXISTS delivery_events (
+    event_id            BIGINT AUTO_INCREMENT PRIMARY KEY,
+    vendor_id           INT,
+    order_id            INT,
+    event_time          DATETIME      NOT NULL,
+    on_time             BOOLEAN       NOT NULL,
+    cost_usd            DECIMAL(10,2) NOT NULL,
+    units               DECIMAL(8,2)  NOT NULL DEFAULT 1,
+    compliance_score    DECIMAL(5,2),   -- per-delivery audit score out of 100
+    INDEX idx_events_time (event_time),
+    INDEX idx_events_vendor_time (vendor_id, event_time),
+    FOREIGN KEY (vendor_id) REFERENCES vendors(vendor_id),
+    FOREIGN KEY (order_id)  REFERENCES delivery_orders(order_id)
+);
@@ -0,0 +1,312 @@
+"""
+vendor_kpis.py
+--------------
+Streaming vendor KPI aggregation from the delivery_events ledger.
+
+Each vendor keeps running counts/sums plus exponentially time-decayed sums,
+so a new batch of events updates KPIs in O(batch) instead of rescanning the
+full delivery history. Vendors touched by a batch are tracked so the
+scorecard can re-score only what changed (see rescore_vendors).
+
+The accumulators and the last ingested event_id are saved to a JSON file,
+so a new process resumes from the watermark instead of rescanning the
+ledger (see sync_vendor_kpis).
+
+Author: Mousumi Paul | Jan 2026
+
+Usage:
+    ledger = sync_vendor_kpis()              # load state, ingest new events, save
+    scored = score_vendors(ledger.snapshot())
+
+    ledger = VendorKPILedger()               # in-memory, fed by hand
+    ledger.ingest(events_df)                 # repeat for each new batch
+    scored = score_vendors(ledger.snapshot())
+    ...
+    ledger.ingest(next_batch)
+    scored = rescore_vendors(scored, ledger.pop_changed())
+"""
+
+import os
+import sys
+import json
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from config.config import KPI_HALF_LIFE_DAYS, KPI_STATE_PATH, KPI_EVENT_BATCH
+
+
+# Columns expected on an event batch (mirrors delivery_events, keyed by name);
+# event_id is optional and, when present, advances the ledger's watermark
+EVENT_COLUMNS = ["event_id", "vendor_name", "event_time", "on_time", "cost_usd", "units", "compliance_score"]
+
+# Bump when the saved state layout changes so old files are not loaded
+STATE_FORMAT = 1
+
+SECONDS_PER_DAY = 86400.0
+
+
+class VendorKPIAccumulator:
+    """
+    Running and time-decayed KPI sums for a single vendor.
+
+    Decayed sums are stored relative to `ref_time` (epoch seconds). Because
+    every KPI is a ratio of two sums decayed by the same factor, KPIs can be
+    read at any time without re-decaying.
+    """
+
+    SUM_FIELDS = ["count", "on_time", "cost", "units", "comp_count", "comp_sum"]
+
+    def __init__(self):
+        self.totals  = dict.fromkeys(self.SUM_FIELDS, 0.0)
+        self.decayed = dict.fromkeys(self.SUM_FIELDS, 0.0)
+        self.ref_time = None
+
+    def merge(self, totals: dict, decayed: dict, ref_time: float, decay_rate: float):
+        """
+        Fold pre-aggregated batch sums into this accumulator.
+
+        Args:
+            totals     : Undecayed batch sums keyed by SUM_FIELDS
+            decayed    : Batch sums already decayed to `ref_time`
+            ref_time   : Reference time of the batch sums (epoch seconds)
+            decay_rate : Decay constant per second
+        """
+        if self.ref_time is not None and ref_time > self.ref_time:
+            factor = np.exp(-decay_rate * (ref_time - self.ref_time))
+            for k in self.SUM_FIELDS:
+                self.decayed[k] *= factor
+        self.ref_time = ref_time if self.ref_time is None else max(self.ref_time, ref_time)
+
+        for k in self.SUM_FIELDS:
+            self.totals[k]  += totals[k]
+            self.decayed[k] += decayed[k]
+
+    def kpis(self, decayed: bool = True) -> dict:
+        """Return scorecard KPIs from the decayed (default) or all-time sums."""
+        s = self.decayed if decayed else self.totals
+        return {
+            "on_time_delivery_pct": round(s["on_time"] / s["count"] * 100, 2) if s["count"] else None,
+            "avg_cost_per_unit":    round(s["cost"] / s["units"], 2) if s["units"] else None,
+            "compliance_score":     round(s["comp_sum"] / s["comp_count"], 2) if s["comp_count"] else None,
+            "total_deliveries":     int(self.totals["count"]),
+        }
+
+
+class VendorKPILedger:
+    """
+    Per-vendor KPI accumulators fed by batches of delivery events.
+
+    Args:
+        half_life_days : Half-life of the decayed KPI window
+                         (defaults to KPI_HALF_LIFE_DAYS in config.py)
+    """
+
+    def __init__(self, half_life_days: float = KPI_HALF_LIFE_DAYS):
+        self.half_life_days = half_life_days
+        self.decay_rate = np.log(2) / (half_life_days * SECONDS_PER_DAY)
+        self.accumulators = {}
+        self.changed = set()
+        self.last_event_id = None
+
+    def ingest(self, events) -> int:
+        """
+        Apply a batch of delivery events.
+
+        The batch is reduced to one row of sums per vendor with vectorized
+        pandas operations; only the per-vendor merge is a Python loop.
+
+        Args:
+            events : DataFrame or list of dicts with EVENT_COLUMNS
+
+        Returns:
+            Number of events ingested
+        """
+        ev = pd.DataFrame(events, columns=EVENT_COLUMNS) if not isinstance(events, pd.DataFrame) else events
+        if ev.empty:
+            return 0
+        if "event_id" in ev and ev["event_id"].notna().any():
+            batch_max = int(ev["event_id"].max())
+            self.last_event_id = batch_max if self.last_event_id is None else max(self.last_event_id, batch_max)
+
+        # Explicit epoch seconds: the datetime64 unit pandas picks is not always ns
+        t = ((pd.to_datetime(ev["event_time"]) - pd.Timestamp(0)) / pd.Timedelta(seconds=1)).to_numpy(dtype=float)
+        comp = pd.to_numeric(ev["compliance_score"], errors="coerce").to_numpy(dtype=float)
+        has_comp = ~np.isnan(comp)
+
+        batch = pd.DataFrame({
+            "vendor_name": ev["vendor_name"].to_numpy(),
+            "t":           t,
+            "count":       1.0,
+            "on_time":     ev["on_time"].astype(float).to_numpy(),
+            "cost":        ev["cost_usd"].astype(float).to_numpy(),
+            "units":       ev["units"].astype(float).to_numpy(),
+            "comp_count":  has_comp.astype(float),
+            "comp_sum":    np.where(has_comp, comp, 0.0),
+        })
+
+        # Decay each event to its vendor's batch reference time
+        prior_ref = batch["vendor_name"].map(
+            {v: a.ref_time for v, a in self.accumulators.items() if a.ref_time is not None}
+        ).fillna(-np.inf).to_numpy()
+        ref = np.maximum(batch.groupby("vendor_name")["t"].transform("max").to_numpy(), prior_ref)
+        weight = np.exp(-self.decay_rate * (ref - batch["t"].to_numpy()))
+
+        fields = VendorKPIAccumulator.SUM_FIELDS
+        decayed = batch[fields].mul(weight, axis=0).add_prefix("d_")
+        decayed["vendor_name"] = batch["vendor_name"]
+        decayed["ref"] = ref
+
+        totals = batch.groupby("vendor_name")[fields].sum()
+        decayed = decayed.groupby("vendor_name").agg(
+            {**{f"d_{f}": "sum" for f in fields}, "ref": "max"}
+        )
+
+        for vendor, row in totals.iterrows():
+            d = decayed.loc[vendor]
+            acc = self.accumulators.setdefault(vendor, VendorKPIAccumulator())
+            acc.merge(
+                totals=row.to_dict(),
+                decayed={f: d[f"d_{f}"] for f in fields},
+                ref_time=float(d["ref"]),
+                decay_rate=self.decay_rate,
+            )
+            self.changed.add(vendor)
+
+        return len(batch)
+
+    def snapshot(self, decayed: bool = True) -> pd.DataFrame:
+        """Return KPIs for every vendor, in the VENDOR_DATA column layout."""
+        return self._frame(self.accumulators.keys(), decayed)
+
+    def pop_changed(self, decayed: bool = True) -> pd.DataFrame:
+        """Return KPIs for vendors updated since the last call, and reset tracking."""
+        changed, self.changed = self.changed, set()
+        return self._frame(changed, decayed)
+
+    def save(self, path: str = KPI_STATE_PATH):
+        """
+        Write the accumulators and the last ingested event_id to `path`.
+
+        Args:
+            path : JSON file to write (replaced atomically)
+        """
+        state = {
+            "format":         STATE_FORMAT,
+            "half_life_days": self.half_life_days,
+            "last_event_id":  self.last_event_id,
+            "vendors": {
+                v: {"totals": a.totals, "decayed": a.decayed, "ref_time": a.ref_time}
+                for v, a in self.accumulators.items()
+            },
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str = KPI_STATE_PATH, half_life_days: float = KPI_HALF_LIFE_DAYS):
+        """
+        Restore a ledger saved with save().
+
+        A missing file gives an empty ledger. A file that is unreadable, in
+        an older layout or saved with a different half-life is ignored, so
+        the ledger is rebuilt from the first event.
+
+        Args:
+            path           : JSON file written by save()
+            half_life_days : Half-life the ledger must use
+
+        Returns:
+            VendorKPILedger
+        """
+        ledger = cls(half_life_days)
+        if not path or not os.path.exists(path):
+            return ledger
+        try:
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state["format"] != STATE_FORMAT or state["half_life_days"] != half_life_days:
+                raise ValueError("saved with a different format or half-life")
+            for vendor, saved in state["vendors"].items():
+                acc = VendorKPIAccumulator()
+                acc.totals   = {k: float(saved["totals"][k]) for k in acc.SUM_FIELDS}
+                acc.decayed  = {k: float(saved["decayed"][k]) for k in acc.SUM_FIELDS}
+                acc.ref_time = None if saved["ref_time"] is None else float(saved["ref_time"])
+                ledger.accumulators[vendor] = acc
+            ledger.last_event_id = None if state["last_event_id"] is None else int(state["last_event_id"])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"[KPI ERROR] Ignoring unusable KPI state {path}: {e}")
+            return cls(half_life_days)
+        return ledger
+
+    def _frame(self, vendors, decayed: bool) -> pd.DataFrame:
+        rows = [{"vendor_name": v, **self.accumulators[v].kpis(decayed)} for v in sorted(vendors)]
+        return pd.DataFrame(rows, columns=[
+            "vendor_name", "on_time_delivery_pct", "avg_cost_per_unit",
+            "compliance_score", "total_deliveries",
+        ]).astype({"on_time_delivery_pct": float, "avg_cost_per_unit": float, "compliance_score": float})
+
+
+def fetch_delivery_events(after_event_id: int = None, limit: int = None) -> pd.DataFrame:
+    """
+    Load delivery events from the MySQL ledger, in event_id order.
+
+    Paging is on the AUTO_INCREMENT event_id rather than event_time, so
+    events that arrive late, or share a second with the previous page's
+    last event, are still picked up.
+
+    Args:
+        after_event_id : Only events with a larger event_id are returned
+                         (None starts from the first event)
+        limit          : Maximum number of events to return (None = all)
+
+    Returns:
+        DataFrame with EVENT_COLUMNS
+    """
+    from scripts.db_connector import execute_query
+
+    query = """
+        SELECT e.event_id, v.vendor_name, e.event_time, e.on_time, e.cost_usd, e.units, e.compliance_score
+        FROM delivery_events e
+        JOIN vendors v ON e.vendor_id = v.vendor_id
+        WHERE e.event_id > %s
+        ORDER BY e.event_id
+    """
+    params = (after_event_id or 0,)
+    if limit:
+        query += " LIMIT %s"
+        params += (limit,)
+    rows = execute_query(query, params) or []
+    return pd.DataFrame(rows, columns=EVENT_COLUMNS)
+
+
+def sync_vendor_kpis(path: str = KPI_STATE_PATH, batch_size: int = KPI_EVENT_BATCH) -> VendorKPILedger:
+    """
+    Bring the saved vendor KPIs up to date with the delivery_events ledger.
+
+    Loads the saved state, ingests only events after its last event_id
+    (in pages of `batch_size`), and saves the state again.
+
+    Args:
+        path       : JSON state file (see VendorKPILedger.save)
+        batch_size : Events fetched per query
+
+    Returns:
+        The updated VendorKPILedger; pop_changed() lists the vendors that
+        received new events
+    """
+    ledger = VendorKPILedger.load(path)
+    ingested = 0
+    while True:
+        events = fetch_delivery_events(ledger.last_event_id, batch_size)
+        ingested += ledger.ingest(events)
+        if len(events) < batch_size:
+            break
+
+    if ingested:
+        ledger.save(path)
+    print(f"[KPI] Ingested {ingested} new delivery events (last event_id: {ledger.last_event_id})")
+    return ledger
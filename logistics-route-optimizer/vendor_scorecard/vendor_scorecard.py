@@ -48,6 +48,22 @@ def normalize(series: pd.Series) -> pd.Series:
     return (series - min_val) / (max_val - min_val) * 100
 
 
+KPI_COLUMNS   = ["on_time_delivery_pct", "avg_cost_per_unit", "compliance_score"]
+NORM_COLUMNS  = ["norm_on_time", "norm_cost_inv", "norm_compliance"]
+SCORE_COLUMNS = NORM_COLUMNS + ["weighted_score", "rank", "risk_category"]
+
+# Normalized score used for a KPI a vendor has no data for (e.g. no audited
+# deliveries yet): mid-scale, so a gap neither rewards nor sinks the vendor
+MISSING_KPI_SCORE = 50.0
+
+
+def risk_label(score: float) -> str:
+    """Map a weighted score to a procurement risk category."""
+    if score >= 75:   return "LOW"
+    elif score >= 55: return "MEDIUM"
+    else:             return "HIGH"
+
+
 def score_vendors(df: pd.DataFrame) -> pd.DataFrame:
     """
     Apply weighted scoring to vendor data.
@@ -56,15 +72,18 @@ def score_vendors(df: pd.DataFrame) -> pd.DataFrame:
       - on_time_delivery_pct : Higher = better (normalize ascending)
       - avg_cost_per_unit    : Lower  = better (normalize descending)
       - compliance_score     : Higher = better (normalize ascending)
+    Missing KPI values are scored as MISSING_KPI_SCORE.
     
     Weighted score = (w1 * norm_on_time) + (w2 * norm_cost_inv) + (w3 * norm_compliance)
     """
     df = df.copy()
+    df[KPI_COLUMNS] = df[KPI_COLUMNS].apply(pd.to_numeric, errors="coerce")
 
     # Normalize
     df["norm_on_time"]    = normalize(df["on_time_delivery_pct"])
     df["norm_cost_inv"]   = normalize(df["avg_cost_per_unit"].max() - df["avg_cost_per_unit"])  # invert
     df["norm_compliance"] = normalize(df["compliance_score"])
+    df[NORM_COLUMNS] = df[NORM_COLUMNS].fillna(MISSING_KPI_SCORE)
 
     # Weighted score
     w = VENDOR_WEIGHTS
@@ -74,17 +93,69 @@ def score_vendors(df: pd.DataFrame) -> pd.DataFrame:
         w["compliance"]       * df["norm_compliance"]
     ).round(2)
 
-    # Rank (1 = best)
-    df["rank"] = df["weighted_score"].rank(ascending=False, method="min").astype(int)
+    return _rank_vendors(df)
 
-    # Risk category
-    def risk_label(score):
-        if score >= 75:   return "LOW"
-        elif score >= 55: return "MEDIUM"
-        else:             return "HIGH"
 
-    df["risk_category"] = df["weighted_score"].apply(risk_label)
+def rescore_vendors(scored: pd.DataFrame, changed: pd.DataFrame) -> pd.DataFrame:
+    """
+    Re-score only vendors whose KPIs changed since `scored` was produced.
+
+    Min-max normalization depends on the KPI range across all vendors, so
+    changed rows are normalized against the existing bounds when those
+    bounds still hold; if an update moves a min/max (or adds a vendor),
+    this falls back to a full score_vendors() pass. Ranks and risk
+    categories are always refreshed.
+
+    Args:
+        scored  : Output of score_vendors / rescore_vendors
+        changed : Rows with vendor_name and updated KPI_COLUMNS
+                  (e.g. VendorKPILedger.pop_changed())
+
+    Returns:
+        Scored DataFrame in the same layout as score_vendors
+    """
+    if changed.empty:
+        return scored
 
+    df = scored.set_index("vendor_name")
+    updates = changed.set_index("vendor_name")
+    kpis = [c for c in KPI_COLUMNS if c in updates.columns]
+    updates[kpis] = updates[kpis].apply(pd.to_numeric, errors="coerce")
+    bounds = {c: (df[c].min(), df[c].max()) for c in KPI_COLUMNS}
+
+    update_cols = [c for c in updates.columns if c in df.columns]
+    is_new = ~updates.index.isin(df.index)
+    df = pd.concat([df, updates.loc[is_new, update_cols]])
+    df.loc[updates.index, update_cols] = updates[update_cols]
+
+    if is_new.any() or any((df[c].min(), df[c].max()) != bounds[c] for c in KPI_COLUMNS):
+        return score_vendors(df.drop(columns=SCORE_COLUMNS).reset_index())
+
+    def scaled(values: pd.Series, lo: float, hi: float) -> pd.Series:
+        return (values - lo) / (hi - lo) * 100 if hi != lo else pd.Series(100.0, index=values.index)
+
+    rows = df.loc[updates.index]
+    (t_lo, t_hi), (c_lo, c_hi), (k_lo, k_hi) = (bounds[c] for c in KPI_COLUMNS)
+    df.loc[updates.index, "norm_on_time"]    = scaled(rows["on_time_delivery_pct"], t_lo, t_hi)
+    df.loc[updates.index, "norm_cost_inv"]   = scaled(c_hi - rows["avg_cost_per_unit"], 0, c_hi - c_lo)
+    df.loc[updates.index, "norm_compliance"] = scaled(rows["compliance_score"], k_lo, k_hi)
+    df.loc[updates.index, NORM_COLUMNS] = df.loc[updates.index, NORM_COLUMNS].fillna(MISSING_KPI_SCORE)
+
+    w = VENDOR_WEIGHTS
+    rows = df.loc[updates.index]
+    df.loc[updates.index, "weighted_score"] = (
+        w["on_time_delivery"] * rows["norm_on_time"] +
+        w["cost_efficiency"]  * rows["norm_cost_inv"] +
+        w["compliance"]       * rows["norm_compliance"]
+    ).round(2)
+
+    return _rank_vendors(df.reset_index())
+
+
+def _rank_vendors(df: pd.DataFrame) -> pd.DataFrame:
+    """Assign rank (1 = best) and risk category from weighted_score."""
+    df["rank"] = df["weighted_score"].rank(ascending=False, method="min", na_option="bottom").astype(int)
+    df["risk_category"] = df["weighted_score"].apply(risk_label)
     return df.sort_values("rank")
 
 